@@ -4,6 +4,12 @@
 """Moonraker Web Client"""
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util import Retry
+
+# (connect, read) timeouts in seconds. The requests are made from the NFC
+# thread, so an unreachable moonraker should fail fast.
+REQUEST_TIMEOUT = (3, 10)
 
 
 # pylint: disable=R0903
@@ -13,6 +19,17 @@ class MoonrakerWebClient:
     def __init__(self, url: str):
         self.url = url
 
+        # Keep the connection to moonraker open between tag reads.
+        retries = Retry(total=1, backoff_factor=0.1)
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=2, max_retries=retries)
+        self._session = requests.Session()
+        self._session.mount("http://", adapter)
+        self._session.mount("https://", adapter)
+
+    def close(self):
+        """Close the connection to moonraker"""
+        self._session.close()
+
     def set_spool_and_filament(self, spool: int, filament: int):
         """Calls moonraker with the current spool & filament"""
 
@@ -23,8 +40,8 @@ class MoonrakerWebClient:
             ]
         }
 
-        response = requests.post(
-            self.url + "/api/printer/command", timeout=10, json=commands
+        response = self._session.post(
+            self.url + "/api/printer/command", timeout=REQUEST_TIMEOUT, json=commands
         )
         if response.status_code != 200:
             raise ValueError(f"Request to moonraker failed: {response}")
@@ -3,6 +3,7 @@
 
 """ NFC tag handling """
 
+import re
 import time
 import logging
 from threading import Lock, Event
@@ -16,6 +17,16 @@ SPOOL = "SPOOL"
 FILAMENT = "FILAMENT"
 NDEF_TEXT_TYPE = "urn:nfc:wkt:T"
 
+# The characters str.splitlines() treats as line boundaries.
+LINE_BREAKS = r"\n\r\x0b\x0c\x1c-\x1e\x85\u2028\u2029"
+
+# Matches the "SPOOL:<id>" and "FILAMENT:<id>" lines in a text record.
+TAG_DATA_RE = re.compile(
+    rf"(?:\A|(?<=[{LINE_BREAKS}]))"
+    rf"(?P<key>{SPOOL}|{FILAMENT}):[ \t]*(?P<value>[0-9]+)[ \t]*"
+    rf"(?=[{LINE_BREAKS}]|\Z)"
+)
+
 logger = logging.getLogger(__name__)
 
 
@@ -46,6 +57,8 @@ class NfcHandler:
     def get_data_from_ndef_records(cls, records: ndef.TextRecord):
         """Find wanted data from the NDEF records.
 
+        If a value occurs more than once, the first occurrence is used.
+
         >>> import ndef
         >>> record0 = ndef.TextRecord("")
         >>> record1 = ndef.TextRecord("SPOOL:23\\n")
@@ -67,21 +80,55 @@ class NfcHandler:
         ('23', '14')
         >>> NfcHandler.get_data_from_ndef_records([record2, record1])
         ('23', '14')
+        >>> record4 = ndef.TextRecord("SPOOL:23:1\\nFILAMENT\\n")
+        >>> NfcHandler.get_data_from_ndef_records([record4])
+        (None, None)
+        >>> record5 = ndef.TextRecord("XSPOOL:1\\r\\nSPOOL:23\\r\\nFILAMENT:14")
+        >>> NfcHandler.get_data_from_ndef_records([record5])
+        ('23', '14')
+        >>> record6 = ndef.TextRecord("SPOOL:1\\nFILAMENT:2\\n")
+        >>> NfcHandler.get_data_from_ndef_records([record3, record6])
+        ('23', '14')
+        >>> record7 = ndef.TextRecord("SPOOL:abc\\nFILAMENT:\\n")
+        >>> NfcHandler.get_data_from_ndef_records([record7])
+        (None, None)
+        >>> record8 = ndef.TextRecord("SPOOL:23\\rFILAMENT:14")
+        >>> NfcHandler.get_data_from_ndef_records([record8])
+        ('23', '14')
+        >>> record9 = ndef.TextRecord("SPOOL:23\\u2028FILAMENT:14\\x0b")
+        >>> NfcHandler.get_data_from_ndef_records([record9])
+        ('23', '14')
+        >>> record10 = ndef.TextRecord("SPOOL:23 \\nFILAMENT:14\\t\\n")
+        >>> NfcHandler.get_data_from_ndef_records([record10])
+        ('23', '14')
+        >>> record11 = ndef.TextRecord("SPOOL: 23\\nFILAMENT:\\t14")
+        >>> NfcHandler.get_data_from_ndef_records([record11])
+        ('23', '14')
+        >>> record12 = ndef.TextRecord("SPOOL:23\\nSPOOL:24\\nFILAMENT:1")
+        >>> NfcHandler.get_data_from_ndef_records([record12])
+        ('23', '1')
+        >>> record13 = ndef.TextRecord("SPOOL:1\\nFILAMENT:2\\nSPOOL:3")
+        >>> NfcHandler.get_data_from_ndef_records([record13])
+        ('1', '2')
+        >>> NfcHandler.get_data_from_ndef_records([record1, record3, record2])
+        ('23', '14')
         """
 
         spool = None
         filament = None
+        log_other_records = logger.isEnabledFor(logging.INFO)
 
         for record in records:
             if record.type == NDEF_TEXT_TYPE:
-                for line in record.text.splitlines():
-                    line = line.split(":")
-                    if len(line) == 2:
-                        if line[0] == SPOOL:
-                            spool = line[1]
-                        if line[0] == FILAMENT:
-                            filament = line[1]
-            else:
+                for match in TAG_DATA_RE.finditer(record.text):
+                    if match.group("key") == SPOOL:
+                        if spool is None:
+                            spool = match.group("value")
+                    elif filament is None:
+                        filament = match.group("value")
+                    if spool is not None and filament is not None:
+                        return spool, filament
+            elif log_other_records:
                 logger.info("Read other record: %s", record)
 
         return spool, filament
@@ -3,24 +3,74 @@
 
 """Spoolman client"""
 
-import json
+import time
+from threading import Lock
+
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util import Retry
+
+# (connect, read) timeouts in seconds for requests to spoolman.
+REQUEST_TIMEOUT = (3, 10)
 
 
 # pylint: disable=R0903
 class SpoolmanClient:
     """Spoolman Web Client"""
 
-    def __init__(self, url: str):
+    __slots__ = (
+        "url",
+        "cache_ttl",
+        "_spools",
+        "_spools_fetched",
+        "_spools_lock",
+        "_session",
+    )
+
+    def __init__(self, url: str, cache_ttl: float = 0):
         if url.endswith("/"):
             url = url[:-1]
         self.url = url
+        self.cache_ttl = cache_ttl
+        self._spools = None
+        self._spools_fetched = 0.0
+        self._spools_lock = Lock()
+
+        # Reuse connections to spoolman instead of reconnecting for each call.
+        retries = Retry(total=2, backoff_factor=0.1, status_forcelist=(502, 503, 504))
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=8, max_retries=retries)
+        self._session = requests.Session()
+        self._session.headers.update({"Accept": "application/json"})
+        self._session.mount("http://", adapter)
+        self._session.mount("https://", adapter)
 
-    def get_spools(self):
-        """Get the spools from spoolman"""
+    def close(self):
+        """Close the connections to spoolman"""
+        self._session.close()
+
+    def get_spools(self, use_cache: bool = True):
+        """Get the spools from spoolman.
+
+        A list fetched less than cache_ttl seconds ago is reused, unless
+        use_cache is False. A cache_ttl of 0 disables the cache.
+        """
+        if use_cache and self.cache_ttl > 0:
+            with self._spools_lock:
+                age = time.monotonic() - self._spools_fetched
+                if self._spools is not None and age < self.cache_ttl:
+                    return self._spools
+
+        started = time.monotonic()
         url = self.url + "/api/v1/spool"
-        response = requests.get(url, timeout=10)
+        response = self._session.get(url, timeout=REQUEST_TIMEOUT)
         if response.status_code != 200:
             raise ValueError(f"Request to spoolman failed: {response}")
-        records = json.loads(response.text)
+        records = response.json()
+
+        if self.cache_ttl > 0:
+            with self._spools_lock:
+                # Don't let a slow, older fetch replace a newer list.
+                if self._spools is None or started > self._spools_fetched:
+                    self._spools = records
+                    self._spools_fetched = started
         return records
@@ -12,7 +12,7 @@ import shutil
 import threading
 from pathlib import Path
 
-from flask import Flask, render_template
+from flask import Flask, make_response, render_template, request
 import toml
 
 from lib.moonraker_web_client import MoonrakerWebClient
@@ -53,7 +53,9 @@ if not args:
     print(f"Created {to_filename}, please update it", file=sys.stderr)
     sys.exit(1)
 
-spoolman = SpoolmanClient(args["spoolman"]["spoolman-url"])
+spoolman = SpoolmanClient(
+    args["spoolman"]["spoolman-url"], args["spoolman"].get("cache-ttl", 0)
+)
 moonraker = MoonrakerWebClient(args["moonraker"]["moonraker-url"])
 nfc_handler = NfcHandler(args["nfc"]["nfc-device"])
 
@@ -61,17 +63,24 @@ nfc_handler = NfcHandler(args["nfc"]["nfc-device"])
 app = Flask(__name__)
 
 
+# pylint: disable=R0903
+class SentSpoolState:
+    """The spool & filament last sent to klipper"""
+
+    __slots__ = ("spool", "filament")
+
+    def __init__(self):
+        self.spool = None
+        self.filament = None
+
+
+sent_state = SentSpoolState()
+
+
 def set_spool_and_filament(spool: int, filament: int):
     """Calls moonraker with the current spool & filament"""
 
-    if "old_spool" not in set_spool_and_filament.__dict__:
-        set_spool_and_filament.old_spool = None
-        set_spool_and_filament.old_filament = None
-
-    if (
-        set_spool_and_filament.old_spool == spool
-        and set_spool_and_filament.old_filament == filament
-    ):
+    if sent_state.spool == spool and sent_state.filament == filament:
         app.logger.info("Read same spool & filament")
         return
 
@@ -79,8 +88,8 @@ def set_spool_and_filament(spool: int, filament: int):
 
     # In case the post fails, we might not know if the server has received
     # it or not, so set them to None:
-    set_spool_and_filament.old_spool = None
-    set_spool_and_filament.old_filament = None
+    sent_state.spool = None
+    sent_state.filament = None
 
     try:
         moonraker.set_spool_and_filament(spool, filament)
@@ -88,8 +97,8 @@ def set_spool_and_filament(spool: int, filament: int):
         app.logger.error(ex)
         return
 
-    set_spool_and_filament.old_spool = spool
-    set_spool_and_filament.old_filament = filament
+    sent_state.spool = spool
+    sent_state.filament = filament
 
 
 @app.route("/w/<int:spool>/<int:filament>")
@@ -108,9 +117,15 @@ def index():
     """
     Returns the main index page.
     """
-    spools = spoolman.get_spools()
+    # A reload asks for fresh data, so don't serve a cached spool list then.
+    cache_control = request.cache_control
+    use_cache = not (cache_control.no_cache or cache_control.max_age == 0)
+    spools = spoolman.get_spools(use_cache=use_cache)
 
-    return render_template("index.html", spools=spools)
+    # Let browsers revalidate the page instead of downloading it again.
+    response = make_response(render_template("index.html", spools=spools))
+    response.add_etag()
+    return response.make_conditional(request)
 
 
 def should_clear_spool() -> bool:
@@ -123,15 +138,12 @@ def should_clear_spool() -> bool:
 def on_nfc_tag_present(spool, filament):
     """Handles a read tag"""
 
-    if not should_clear_spool():
-        if not (spool and filament):
-            app.logger.info("Did not find spool and filament records in tag")
-    if should_clear_spool() or (spool and filament):
-        if not spool:
-            spool = 0
-        if not filament:
-            filament = 0
+    if spool and filament:
         set_spool_and_filament(spool, filament)
+    elif should_clear_spool():
+        set_spool_and_filament(spool or 0, filament or 0)
+    else:
+        app.logger.info("Did not find spool and filament records in tag")
 
 
 def on_nfc_no_tag_present():
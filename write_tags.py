@@ -6,7 +6,6 @@
 """ A program to write NFC tags from Spoolman's data """
 
 import argparse
-import json
 import time
 
 import ndef
@@ -79,7 +78,7 @@ class PostSelectForm(npyscreen.FormBaseNew):
 
         url = args.url + "/api/v1/spool"
         records = requests.get(url, timeout=10)
-        self.records = json.loads(records.text)
+        self.records = records.json()
         self.records = sorted(self.records, key=lambda x: x["id"], reverse=True)
 
         self.posts = self.add(